@@ -7,6 +7,7 @@ import os
 from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict, TypeVar
@@ -44,14 +45,37 @@ def data_row(cols: list[str], rows: list[dict[str, SparqlResultValue]]) -> dict[
        samples result of all columns in query
     """
     full_row: dict[str, SparqlResultValue] = {}
+    missing = set(cols)
     for row in rows:
-        if set(cols).difference(full_row.keys()):
-            full_row.update(row)
-        else:
+        if not missing:
             break
+        full_row.update(row)
+        missing.difference_update(row)
     return full_row
 
 
+def _is_plain_sparql_wrapper(sparql_wrapper: SPARQLWrapper) -> bool:
+    # Subclasses, mocks and instances with patched query methods may not do a real http request
+    if type(sparql_wrapper) is not SPARQLWrapper:
+        return False
+    return not {"query", "queryAndConvert"} & vars(sparql_wrapper).keys()
+
+
+def query_sparql_result(sparql_wrapper: SPARQLWrapper) -> SparqlResultJson:
+    """Execute the query in sparql_wrapper and parse the result.
+
+    The raw response is parsed directly by pydantic's native JSON parser instead of first being
+    converted to python objects by the json module in SPARQLWrapper. Anything but a plain
+    SPARQLWrapper (e.g. a subclass or a patched instance returning fixed results) is converted via
+    queryAndConvert.
+    """
+    if not _is_plain_sparql_wrapper(sparql_wrapper):
+        return SparqlResultJson.model_validate(sparql_wrapper.queryAndConvert())
+
+    with sparql_wrapper.query().response as response:
+        return SparqlResultJson.model_validate_json(response.read())
+
+
 class RestApi(StrEnum):
     RDF4J = "RDF4J"
     BLAZEGRAPH = "BLAZEGRAPH"
@@ -237,9 +261,7 @@ class GraphDBClient:
             after=retry_cb.after,
         ):
             with attempt:
-                results = sparql_wrapper.queryAndConvert()
-
-                sparql_result = SparqlResultJson.model_validate(results)
+                sparql_result = query_sparql_result(sparql_wrapper)
                 if self.service_cfg.validate:
                     sparql_result.validate_column_consistency()
         return sparql_result or SparqlResultJson(head=SparqlResultHead(), results=SparqlData(bindings=[]))
@@ -427,22 +449,37 @@ def new_repo_blazegraph(url: str, repo: str, protocol: str = "https", token: str
 def config_bytes_from_template(template: Path, params: dict[str, str], encoding: str = "utf-8") -> bytes:
     """Replace value in template file with items in params.
 
+    The result is cached, so repeated calls with the same template and parameters do not
+    read the template file from disk again. The cache is keyed on the modification time of
+    the template, so changes to the file are picked up.
+
     Args:
         template: Path to template file
         params: Dict with key-value pairs where key must be enclode by double curly braces
             in the template file ({{}}). {{key}} will be replaced by value
         encoding: use this encoding when replacing items
     """
+    return _config_bytes_from_template(template, template.stat().st_mtime_ns, tuple(sorted(params.items())), encoding)
+
+
+@lru_cache(maxsize=32)
+def _config_bytes_from_template(
+    template: Path,
+    mtime_ns: int,  # noqa: ARG001 (only part of the cache key)
+    params: tuple[tuple[str, str], ...],
+    encoding: str,
+) -> bytes:
     with template.open("rb") as infile:
         data = infile.read()
 
-    for param, value in params.items():
+    for param, value in params:
         enc_templ = f"{{{{{param}}}}}".encode(encoding)
         enc_value = value.encode(encoding)
         data = data.replace(enc_templ, enc_value)
     return data
 
 
+@lru_cache(maxsize=1)
 def confpath() -> Path:
     return Path(__file__).parent.parent / "pkg_data"
 
@@ -99,7 +99,7 @@ class Model:
     ) -> None:
         self.clients = clients
         self.config = config or ModelConfig()
-        self.mapper = mapper or TypeMapper(self.get_client("Type mapper").service_cfg)
+        self.mapper = mapper or TypeMapper(client=self.get_client("Type mapper"))
 
     @property
     def distinct_clients(self) -> list[GraphDBClient]:
@@ -183,9 +183,9 @@ class Model:
         """Convert provided template to query."""
         substitutes = substitutes or {}
 
-        # Extract name from the query. We don't need to perform actual substitutions to do this,
-        # we just let placeholder be left
-        name = query_name(template.safe_substitute())
+        # Extract name from the raw template. The name line holds no placeholders, so there is no
+        # need to render the full query just to read it
+        name = query_name(template.template)
         client = self.get_client(name)
         state_repo = self.config.system_state_repo or client.service_cfg.url
         eq_repo = self.config.eq_repo or client.service_cfg.url
@@ -98,8 +98,10 @@ class TypeMapper:
         self,
         service_cfg: ServiceConfig | None = None,
         custom_additions: dict[str, Any] | None = None,
+        client: GraphDBClient | None = None,
     ) -> None:
-        self.client = GraphDBClient(service_cfg)
+        # Reuse an existing client (and its already fetched prefixes) when given
+        self.client = client or GraphDBClient(service_cfg)
 
         self.query = TYPE_MAPPER_QUERY.substitute(self.client.prefixes)
         custom_additions = custom_additions or {}
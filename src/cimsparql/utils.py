@@ -2,11 +2,13 @@
 
 import re
 
+_QUERY_NAME_PATTERN = re.compile("^# Name: ([a-zA-Z0-9 ]+)")
+
 
 def query_name(query: str) -> str:
     """Extract the name of the query provided that the first line starts with # Name: <name>.
 
     If no match is found, an empty string is returned
     """
-    m = re.search("^# Name: ([a-zA-Z0-9 ]+)", query)
+    m = _QUERY_NAME_PATTERN.search(query)
     return m.group(1) if m else ""
@@ -1,19 +1,25 @@
 import asyncio
+import hashlib
 import logging
 import os
-import re
 from base64 import b64encode
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from http import HTTPStatus
+from pathlib import Path
 from typing import Any
+from unittest import mock
+from urllib.parse import urlsplit
 
 import httpx
 import pandas as pd
 import pytest
+import tenacity
 from pytest_httpserver import HeaderValueMatcher, HTTPServer
 from SPARQLWrapper import SPARQLWrapper
+from SPARQLWrapper.SPARQLExceptions import QueryBadFormed
 
 import tests.t_utils.common as t_common
 import tests.t_utils.custom_models as t_custom
@@ -29,7 +35,7 @@ from cimsparql.graphdb import (
     repos,
 )
 from cimsparql.model import Model, SingleClientModel
-from cimsparql.sparql_result_json import SparqlResultJsonFactory
+from cimsparql.sparql_result_json import SparqlResultJsonFactory, SparqlResultValue
 from cimsparql.type_mapper import TypeMapper
 
 logger = logging.getLogger()
@@ -88,12 +94,55 @@ async def collect_data(model: Model) -> dict[str, pd.DataFrame]:
     )
 
     args = defaultdict(tuple, {"exchange": ("NO|SE",)})
-    result = await asyncio.gather(
-        *[loop.run_in_executor(None, exception_logging, query, *args[query.__name__]) for query in queries]
-    )
+
+    # One worker per query, so that all queries are in flight at the same time
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        result = await asyncio.gather(
+            *[loop.run_in_executor(executor, exception_logging, query, *args[query.__name__]) for query in queries]
+        )
     return {query.__name__: res for query, res in zip(queries, result, strict=False)}
 
 
+@pytest.fixture(scope="module", autouse=True)
+def memoized_get_table() -> Generator[None, None, None]:
+    """Serve repeated queries in this module from memory instead of sending them to the server again.
+
+    The tests in this module only read from the repositories, so results can be shared. Cached frames
+    must be treated as read-only. If CIMSPARQL_TEST_CACHE_DIR is set, results from sparql servers are
+    also persisted in that folder and reused by later test runs (delete the folder to refresh).
+    """
+    cache: dict[tuple[ServiceConfig, str, str], tuple[pd.DataFrame, dict[str, SparqlResultValue]]] = {}
+    get_table = GraphDBClient.get_table
+    cache_dir = os.getenv("CIMSPARQL_TEST_CACHE_DIR")
+
+    def persisted_get_table(client: GraphDBClient, query: str) -> tuple[pd.DataFrame, dict[str, SparqlResultValue]]:
+        if not cache_dir:
+            return get_table(client, query)
+        key = f"{client.sparql.endpoint}\n{client.service_cfg.parameters}\n{query}"
+        path = Path(cache_dir) / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.pkl"
+        if path.exists():
+            return pd.read_pickle(path)  # noqa: S301
+        result = get_table(client, query)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.to_pickle(result, path)
+        return result
+
+    def cached_get_table(client: GraphDBClient, query: str) -> tuple[pd.DataFrame, dict[str, SparqlResultValue]]:
+        # Injected wrappers return results of their own, which must not be shared between tests
+        if type(client.sparql) is not SPARQLWrapper:
+            return get_table(client, query)
+        key = (client.service_cfg, client.sparql.endpoint, query)
+        if key not in cache:
+            cache[key] = persisted_get_table(client, query)
+        # Callers such as MridMapper.map assign columns in place, so never hand out the cached frame
+        df, data_row = cache[key]
+        return df.copy(), data_row
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(GraphDBClient, "get_table", cached_get_table)
+        yield
+
+
 @pytest.mark.parametrize("test_model", t_custom.all_custom_models())
 def test_not_empty(test_model: t_common.ModelTest):
     model = test_model.model
@@ -105,7 +154,7 @@ def test_not_empty(test_model: t_common.ModelTest):
         assert not df.empty, f"Failed for dataframe {name}"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def model() -> Model:
     test_model = t_custom.federated_model()
     if not test_model.model:
@@ -113,6 +162,17 @@ def model() -> Model:
     return test_model.model
 
 
+@pytest.fixture(scope="session")
+def model_data(model: Model) -> dict[str, pd.DataFrame]:
+    """Return the result of all model queries. Shared by tests and must be treated as read-only."""
+    return all_data(model)
+
+
+@pytest.fixture(scope="session")
+def type_mapper(model: Model) -> TypeMapper:
+    return model.mapper
+
+
 def test_cimversion(model: SingleClientModel):
     assert model.cim_version == 16
 
@@ -148,25 +208,25 @@ def test_windings(model: SingleClientModel):
 @pytest.mark.skipif(os.getenv("GRAPHDB_SERVER") is None, reason="Need graphdb server to run")
 def test_borders_no(model: SingleClientModel):
     borders = model.borders(region="NO")
-    assert (borders[["area_1", "area_2"]] == "NO").any(axis=1).all()
-    assert (borders["area_1"] != borders["area_2"]).all()
-
-
-def test_data_row():
-    cols = ["a", "b", "c", "d", "e"]
-    rows = [{"a": 1, "b": 2}, {"c": 3, "d": 4}, {"a": 5, "b": 6}, {"e": 7}]
-    assert not set(data_row(cols, rows)).symmetric_difference(cols)
+    area_1 = borders["area_1"].to_numpy()
+    area_2 = borders["area_2"].to_numpy()
+    assert (((area_1 == "NO") | (area_2 == "NO")) & (area_1 != area_2)).all()
 
 
-def test_data_row_missing_column():
+@pytest.mark.parametrize(
+    ("rows", "missing"),
+    [
+        ([{"a": 1, "b": 2}, {"c": 3, "d": 4}, {"a": 5, "b": 6}, {"e": 7}], set()),
+        ([{"a": 1, "b": 2}, {"c": 3}, {"a": 5, "b": 6}, {"e": 7}], {"d"}),
+    ],
+)
+def test_data_row(rows: list[dict[str, int]], missing: set[str]):
     cols = ["a", "b", "c", "d", "e"]
-    rows = [{"a": 1, "b": 2}, {"c": 3}, {"a": 5, "b": 6}, {"e": 7}]
-    assert set(data_row(cols, rows).keys()).symmetric_difference(cols) == {"d"}
+    assert set(data_row(cols, rows)).symmetric_difference(cols) == missing
 
 
-def test_dtypes(model: SingleClientModel):
-    mapper = TypeMapper(model.client.service_cfg)
-    data = model.client.get_table(mapper.query)[0]
+def test_dtypes(model: SingleClientModel, type_mapper: TypeMapper):
+    data = model.client.get_table(type_mapper.query)[0]
     assert data["sparql_type"].isna().sum() == 0
 
 
@@ -188,6 +248,18 @@ def test_conf_bytes_from_template():
     assert 'rep:repositoryID "test_repo"' in conf_str
 
 
+def test_conf_bytes_from_template_modified(tmp_path: Path):
+    template = tmp_path / "template.ttl"
+    template.write_text("id {{repo}}")
+    assert config_bytes_from_template(template, {"repo": "test_repo"}) == b"id test_repo"
+    assert config_bytes_from_template(template, {"repo": "other_repo"}) == b"id other_repo"
+
+    template.write_text("name {{repo}}")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert config_bytes_from_template(template, {"repo": "test_repo"}) == b"name test_repo"
+
+
 def test_create_delete_repo():
     url = t_common.rdf4j_url()
 
@@ -219,6 +291,10 @@ def test_create_delete_repo():
     assert "test_repo" not in [i.repo_id for i in current_repos]
 
 
+REPOS_USER, REPOS_PASSWD = "user", "password"
+REPOS_AUTH_HEADER = "Basic " + b64encode(f"{REPOS_USER}:{REPOS_PASSWD}".encode()).decode()
+
+
 def test_repos_with_auth(httpserver: HTTPServer):
     response_json = {
         "results": {
@@ -235,20 +311,17 @@ def test_repos_with_auth(httpserver: HTTPServer):
     }
 
     matcher = HeaderValueMatcher({"authorization": lambda value, expect: expect == value})
-    user, password = "user", "password"
-    encoded_user_passwd = b64encode(bytes(f"{user}:{password}", "utf8")).decode("utf8")
     httpserver.expect_request(
         "/repositories",
-        headers={"authorization": f"Basic {encoded_user_passwd}"},
+        headers={"authorization": REPOS_AUTH_HEADER},
         header_value_matcher=matcher,
     ).respond_with_json(response_json)
     url = httpserver.url_for("/repositories")
 
-    matches = re.match(r"^([a-z]+):\/\/([a-z:0-9]+)", url)
-    assert matches
-    protocol, server = matches.groups()
+    parts = urlsplit(url)
+    protocol, server = parts.scheme, parts.netloc
 
-    cfg = ServiceConfig("repo", server=server, protocol=protocol, user=user, passwd=password)
+    cfg = ServiceConfig("repo", server=server, protocol=protocol, user=REPOS_USER, passwd=REPOS_PASSWD)
     repo_info = repos(cfg)
 
     expect = RepoInfo("uri", "id", "title", readable=True, writable=False)
@@ -284,37 +357,66 @@ def test_inject_subclassed_sparql_wrapper():
 
     # Confirm that we can sucessfully run a query
     data = client.get_table("select * where {?s ?p ?o}")[0]
-    assert set(data.columns) == set(wrapper.result.head.variables)
+    assert data.columns.tolist() == wrapper.result.head.variables
 
 
-def test_xnodes(model: Model):
-    dfs = all_data(model)
-    bus = dfs["bus_data"]
-    ac_lines = dfs["ac_lines"].assign(
+def test_exec_query_parses_raw_response(httpserver: HTTPServer):
+    result = SparqlResultJsonFactory.build()
+    httpserver.expect_request("/sparql", method="POST").respond_with_data(
+        result.model_dump_json(by_alias=True), content_type="application/sparql-results+json"
+    )
+    client = GraphDBClient(ServiceConfig(server=httpserver.url_for("/sparql"), rest_api=RestApi.DIRECT_SPARQL_ENDPOINT))
+    assert client.exec_query("select * where {?s ?p ?o}") == result
+
+
+def test_exec_query_patched_instance():
+    result = SparqlResultJsonFactory.build()
+    client = GraphDBClient(ServiceConfig(server="some-server", rest_api=RestApi.DIRECT_SPARQL_ENDPOINT))
+    response = result.model_dump(by_alias=True)
+    # exec_query runs on a deepcopy of the wrapper, so the patched result is checked, not the call
+    with mock.patch.object(client.sparql, "queryAndConvert", return_value=response):
+        assert client.exec_query("select * where {?s ?p ?o}") == result
+
+
+def test_exec_query_bad_query_raises_query_bad_formed(httpserver: HTTPServer):
+    httpserver.expect_request("/sparql", method="POST").respond_with_data(
+        "MALFORMED QUERY: unexpected token", status=HTTPStatus.BAD_REQUEST
+    )
+    client = GraphDBClient(ServiceConfig(server=httpserver.url_for("/sparql"), rest_api=RestApi.DIRECT_SPARQL_ENDPOINT))
+    with pytest.raises(tenacity.RetryError) as exc:
+        client.exec_query("select * where {?s ?p")
+    error = exc.value.last_attempt.exception()
+    assert isinstance(error, QueryBadFormed)
+    assert "unexpected token" in str(error)
+
+
+def test_xnodes(model_data: dict[str, pd.DataFrame]):
+    bus = model_data["bus_data"]
+    ac_lines = model_data["ac_lines"].assign(
         bidzone_1=lambda df: df["node_1"].map(bus["bidzone"]),
         bidzone_2=lambda df: df["node_2"].map(bus["bidzone"]),
     )
-    xnode_branches = ac_lines[ac_lines["name"].str.contains("Xnode")]
-    non_xnode_branches = ac_lines[~ac_lines["name"].str.contains("Xnode")]
+    is_xnode = ac_lines["name"].str.contains("Xnode", regex=False)
+    xnode_branches = ac_lines[is_xnode]
+    non_xnode_branches = ac_lines[~is_xnode]
     assert not xnode_branches.empty
     assert not xnode_branches["bidzone_1"].isna().any()
     assert not xnode_branches["bidzone_2"].isna().any()
 
-    non_xnode_bidzones = set(non_xnode_branches["bidzone_1"]) | set(non_xnode_branches["bidzone_2"])
-    xnode_bidzones = set(xnode_branches["bidzone_1"]) | set(xnode_branches["bidzone_2"])
+    bidzone_cols = ["bidzone_1", "bidzone_2"]
+    non_xnode_bidzones = set(pd.unique(non_xnode_branches[bidzone_cols].to_numpy().ravel("K")))
+    xnode_bidzones = set(pd.unique(xnode_branches[bidzone_cols].to_numpy().ravel("K")))
 
     # Verify that there are no distinct bidzones among the xnodes such as EU, EU-ELSP-1 etc.
     assert xnode_bidzones.issubset(non_xnode_bidzones)
 
 
-def test_bidzone_consistency(model: Model):
-    dfs = all_data(model)
-
+def test_bidzone_consistency(model_data: dict[str, pd.DataFrame]):
     # Verify that all bidzones are consistent regardless of whether they are collected via
     # topological nodes or connectivity nodes
-    bus = dfs["bus_data"]
-    con_nodes = dfs["connectivity_nodes"]
-    ac_lines = dfs["ac_lines"]
+    bus = model_data["bus_data"]
+    con_nodes = model_data["connectivity_nodes"]
+    ac_lines = model_data["ac_lines"]
 
     pd.testing.assert_series_equal(
         ac_lines["node_1"].map(bus["bidzone"]),
@@ -48,7 +48,7 @@ def test_rdf4j_picasso_data(rdf4j_gdb: GraphDBClient, query: str, expect: list[d
 
 
 def test_rdf4j_prefixes(rdf4j_gdb: GraphDBClient):
-    assert set(rdf4j_gdb.prefixes.keys()).issuperset({"ex", "foaf"})
+    assert {"ex", "foaf"}.issubset(rdf4j_gdb.prefixes)
 
 
 @pytest.fixture
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import numpy as np
 import pandas as pd
@@ -12,8 +13,8 @@ from pandas.testing import assert_frame_equal
 
 from cimsparql import type_mapper
 from cimsparql.data_models import CoercingSchema
-from cimsparql.graphdb import RestApi
-from cimsparql.model import ServiceConfig
+from cimsparql.graphdb import GraphDBClient, RestApi
+from cimsparql.model import ServiceConfig, SingleClientModel
 
 if TYPE_CHECKING:
     from typing import Any
@@ -43,6 +44,17 @@ def test_get_map_empty_pandas(httpserver: HTTPServer):
     assert mapper.get_map() == {}
 
 
+def test_model_fetches_prefixes_once(httpserver: HTTPServer):
+    httpserver.expect_request("/repositories/repo/namespaces").respond_with_data("prefix,namespace\n")
+    httpserver.expect_request("/repositories/repo").respond_with_json(empty_sparql_result())
+    server = urlsplit(httpserver.url_for("/")).netloc
+    model = SingleClientModel(GraphDBClient(ServiceConfig("repo", protocol="http", server=server)))
+
+    assert model.mapper.client is model.client
+    namespace_requests = [request for request, _ in httpserver.log if request.path.endswith("/namespaces")]
+    assert len(namespace_requests) == 1
+
+
 def test_map_data_types(httpserver: HTTPServer):
     results = {
         "sparql_type": ["http://c#Degrees", "http://c#Status", "http://c#Amount"],
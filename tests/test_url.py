@@ -6,7 +6,7 @@ import tests.t_utils.custom_models as t_custom
 from cimsparql.graphdb import GraphDBClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gdbc() -> GraphDBClient:
     if not (os.getenv("GRAPHDB_SERVER") and os.getenv("GRAPHDB_TOKEN")):
         pytest.skip("Need graphdb server to run")